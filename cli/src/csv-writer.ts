@@ -0,0 +1,64 @@
+/**
+ * Batched CSV output for the record command.
+ * Writes to stdout, a plain file, or a gzip-compressed file when the path ends in .gz.
+ */
+
+import { createWriteStream } from 'node:fs';
+import type { Writable } from 'node:stream';
+import { createGzip } from 'node:zlib';
+
+export const CSV_FLUSH_LINES = 10_000;
+export const CSV_FLUSH_INTERVAL_MS = 1000;
+
+export type CsvWriter = {
+  writeLine: (line: string) => void;
+  maybeFlush: () => void;
+  close: () => Promise<void>;
+};
+
+// Lines are buffered and written in batches so a recording doesn't issue one
+// write per sample; callers invoke maybeFlush() once per packet. A path ending
+// in .gz is gzip-compressed on the fly.
+export function createCsvWriter(outputPath?: string): CsvWriter {
+  const fileStream = outputPath ? createWriteStream(outputPath, { encoding: 'utf8' }) : null;
+  let stream: Writable | null = fileStream;
+  if (fileStream && outputPath?.endsWith('.gz')) {
+    const gzip = createGzip();
+    gzip.pipe(fileStream);
+    stream = gzip;
+  }
+  let pending: string[] = [];
+  let lastFlush = performance.now();
+
+  const flush = () => {
+    lastFlush = performance.now();
+    if (pending.length === 0) return;
+    const chunk = `${pending.join('\n')}\n`;
+    pending = [];
+    if (stream) {
+      stream.write(chunk);
+    } else {
+      process.stdout.write(chunk);
+    }
+  };
+
+  return {
+    writeLine: (line) => {
+      pending.push(line);
+    },
+    maybeFlush: () => {
+      if (pending.length >= CSV_FLUSH_LINES || performance.now() - lastFlush >= CSV_FLUSH_INTERVAL_MS) {
+        flush();
+      }
+    },
+    close: () => {
+      flush();
+      if (!stream || !fileStream) return Promise.resolve();
+      return new Promise((resolve) => {
+        // Wait for the file itself, which finishes after any gzip trailer is flushed
+        fileStream.once('finish', () => resolve());
+        stream.end();
+      });
+    }
+  };
+}
@@ -1,10 +1,10 @@
-import { createWriteStream } from 'node:fs';
 import { format } from 'node:util';
 import { Command } from 'commander';
 import { SerialPort } from 'serialport';
 import { get } from 'svelte/store';
 import { NodeSerialConnection } from './node-serial';
 import { ContextRegistry, categorizeDevice, type DeviceContext, type DeviceContextParams } from './context-registry';
+import { createCsvWriter } from './csv-writer';
 import {
   createGetMachinePacket,
   createHeartbeatPacket,
@@ -15,13 +15,13 @@ import {
 } from '../../webui/src/lib/packet-encoder';
 import {
   decodePacket,
+  decodeWaveColumns,
   processMachinePacket,
   processSynthesizePacket,
   processWavePacket,
   type ChannelUpdate,
-  type DecodedPacket,
-  isMachinePacket,
-  isWavePacket
+  type WaveColumns,
+  isMachinePacket
 } from '../../webui/src/lib/packet-decoder';
 import { PackType } from '../../webui/src/lib/types';
 import { debugEnabled } from '../../webui/src/lib/debug-logger';
@@ -116,33 +116,6 @@ function delay(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
-type CsvWriter = {
-  writeLine: (line: string) => void;
-  close: () => Promise<void>;
-};
-
-function createCsvWriter(outputPath?: string): CsvWriter {
-  if (outputPath) {
-    const stream = createWriteStream(outputPath, { encoding: 'utf8' });
-    return {
-      writeLine: (line) => {
-        stream.write(`${line}\n`);
-      },
-      close: () =>
-        new Promise((resolve) => {
-          stream.end(() => resolve());
-        })
-    };
-  }
-
-  return {
-    writeLine: (line) => {
-      process.stdout.write(`${line}\n`);
-    },
-    close: async () => {}
-  };
-}
-
 function parseDurationSeconds(value?: string): number | null {
   if (value === undefined) {
     return null;
@@ -258,40 +231,40 @@ async function waitForChannelStatus(
   return processed[channel] ?? processed[0];
 }
 
-type WaveSample = {
-  timeSeconds: number;
-  voltage: number;
-  current: number;
+// Column-oriented sample buffers: one typed array per CSV column instead of an
+// object per sample.
+type WaveSamples = {
+  count: number;
+  timeSeconds: Float64Array;
+  voltage: Float64Array;
+  current: Float64Array;
 };
 
 function extractWaveSamples(
-  packet: DecodedPacket,
+  wave: WaveColumns,
   runningTimeUs: number
-): { samples: WaveSample[]; nextRunningTimeUs: number } | null {
-  if (!isWavePacket(packet)) return null;
-
-  const wave = packet.data;
-  const samples: WaveSample[] = [];
-  const samplesPerGroup = packet.size === 126 ? 2 : packet.size === 206 ? 4 : 0;
-
-  wave.groups.forEach((group) => {
-    const groupElapsedTimeUs = group.timestamp / 10;
-    const pointsInGroup = samplesPerGroup || group.items.length || 1;
-    const timePerSampleUs = pointsInGroup > 0 ? groupElapsedTimeUs / pointsInGroup : 0;
-
-    for (let i = 0; i < pointsInGroup; i++) {
-      const item = group.items[i];
-      if (!item) break;
-      const sampleTimeUs = runningTimeUs + i * timePerSampleUs;
-      samples.push({
-        timeSeconds: sampleTimeUs / 1_000,
-        voltage: item.voltage,
-        current: item.current
-      });
+): { samples: WaveSamples; nextRunningTimeUs: number } {
+  const { groupSize, timestamps, voltage, current } = wave;
+  const count = voltage.length;
+  // Voltage and current columns arrive already scaled; only the time axis is derived here
+  const samples: WaveSamples = {
+    count,
+    timeSeconds: new Float64Array(count),
+    voltage,
+    current
+  };
+
+  let index = 0;
+  for (let group = 0; group < timestamps.length; group++) {
+    const groupElapsedTimeUs = timestamps[group] / 10;
+    const timePerSampleUs = groupElapsedTimeUs / (groupSize || 1);
+
+    for (let i = 0; i < groupSize; i++, index++) {
+      samples.timeSeconds[index] = (runningTimeUs + i * timePerSampleUs) / 1_000;
     }
 
     runningTimeUs += groupElapsedTimeUs;
-  });
+  }
 
   return { samples, nextRunningTimeUs: runningTimeUs };
 }
@@ -469,13 +442,14 @@ async function handleRecordCommand(
     const ignoredChannels = new Set<number>();
 
     const unsubscribe = connection.registerPacketHandler(PackType.WAVE, (packet) => {
-      const decoded = decodePacket(packet);
-      if (!decoded || !isWavePacket(decoded)) return;
+      // Read samples straight into columns; the recorder never needs Kaitai item objects
+      const wave = decodeWaveColumns(packet);
+      if (!wave) return;
 
-      if (decoded.data.channel !== channel) {
-        if (!ignoredChannels.has(decoded.data.channel)) {
-          ignoredChannels.add(decoded.data.channel);
-          log(`Ignoring wave data from channel ${decoded.data.channel}.`);
+      if (wave.channel !== channel) {
+        if (!ignoredChannels.has(wave.channel)) {
+          ignoredChannels.add(wave.channel);
+          log(`Ignoring wave data from channel ${wave.channel}.`);
         }
         return;
       }
@@ -485,16 +459,14 @@ async function handleRecordCommand(
         log(`Receiving wave data for channel ${channel}...`);
       }
 
-      const result = extractWaveSamples(decoded, runningTimeUs);
-      if (!result) return;
-
+      const result = extractWaveSamples(wave, runningTimeUs);
       runningTimeUs = result.nextRunningTimeUs;
-      result.samples.forEach((sample) => {
-        writer.writeLine(
-          `${sample.timeSeconds.toFixed(6)},${sample.voltage.toFixed(6)},${sample.current.toFixed(6)}`
-        );
-        pointCount += 1;
-      });
+      const { count, timeSeconds, voltage, current } = result.samples;
+      for (let i = 0; i < count; i++) {
+        writer.writeLine(`${timeSeconds[i].toFixed(6)},${voltage[i].toFixed(6)},${current[i].toFixed(6)}`);
+      }
+      pointCount += count;
+      writer.maybeFlush();
     });
 
     writer.writeLine('time_s,voltage_v,current_a');
@@ -581,7 +553,7 @@ function registerContextCommands(program: Command, registry: ContextRegistry): v
       .command('record')
       .description('Record waveform data to CSV (stdout by default)')
       .option('--duration <sec>', 'Recording duration in seconds')
-      .option('--output-csv <path>', 'Write CSV to a file instead of stdout')
+      .option('--output-csv <path>', 'Write CSV to a file instead of stdout (gzip-compressed if the path ends in .gz)')
       .action(async (options: RecordCommandOptions) => {
         await handleRecordCommand(alias, context, options);
       });
@@ -9,6 +9,9 @@ const DEFAULT_CONFIG: SerialConfig = {
   flowControl: 'none'
 };
 
+const PACKET_HEADER = Buffer.from([0x5a, 0x5a]);
+const RECEIVE_BUFFER_INITIAL_CAPACITY = 4096;
+
 export interface NodeSerialConnectionOptions {
   portPath: string;
   config?: Partial<SerialConfig>;
@@ -21,6 +24,8 @@ export class NodeSerialConnection {
   private heartbeatTimer: ReturnType<typeof setInterval> | null = null;
   private readonly packetHandlers = new Map<number, PacketHandler[]>();
   private receiveBuffer = Buffer.alloc(0);
+  // Backing store for receiveBuffer; Buffer.alloc never hands out a shared pool slab
+  private receiveStorage = Buffer.alloc(RECEIVE_BUFFER_INITIAL_CAPACITY);
 
   constructor(options: NodeSerialConnectionOptions) {
     this.portPath = options.portPath;
@@ -155,52 +160,74 @@ export class NodeSerialConnection {
   }
 
   private handleIncomingData(chunk: Buffer): void {
-    this.receiveBuffer = Buffer.concat([this.receiveBuffer, chunk]);
+    this.appendToReceiveBuffer(chunk);
     this.processIncomingData();
   }
 
+  // Write into spare capacity after the pending bytes and only compact or grow
+  // the backing store when it runs out, instead of Buffer.concat per chunk.
+  private appendToReceiveBuffer(chunk: Buffer): void {
+    const pending = this.receiveBuffer;
+    const required = pending.length + chunk.length;
+    let storage = this.receiveStorage;
+    let start = pending.buffer === storage.buffer ? pending.byteOffset - storage.byteOffset : -1;
+
+    if (start === -1 || start + required > storage.length) {
+      if (required > storage.length) {
+        storage = Buffer.alloc(Math.max(required, storage.length * 2));
+        this.receiveStorage = storage;
+      }
+      pending.copy(storage, 0);
+      start = 0;
+    }
+
+    chunk.copy(storage, start + pending.length);
+    this.receiveBuffer = storage.subarray(start, start + required);
+  }
+
   private processIncomingData(): void {
-    while (this.receiveBuffer.length >= 6) {
-      const headerIndex = this.findHeader();
+    // Consume packets by offset and trim the buffer once, rather than per packet.
+    const buffer = this.receiveBuffer;
+    let offset = 0;
+
+    while (buffer.length - offset >= 6) {
+      const headerIndex = this.findHeader(offset);
       if (headerIndex === -1) {
-        if (this.receiveBuffer.length > 256) {
-          this.receiveBuffer = Buffer.alloc(0);
+        if (buffer.length - offset > 256) {
+          offset = buffer.length;
         }
         break;
       }
 
-      if (headerIndex > 0) {
-        this.receiveBuffer = this.receiveBuffer.slice(headerIndex);
-      }
+      offset = headerIndex;
 
-      if (this.receiveBuffer.length < 4) {
+      if (buffer.length - offset < 4) {
         break;
       }
 
-      const packetSize = this.receiveBuffer[3];
+      const packetSize = buffer[offset + 3];
       if (packetSize < 6) {
         // Drop one byte to avoid a tight loop on malformed sizes.
-        this.receiveBuffer = this.receiveBuffer.slice(1);
+        offset += 1;
         continue;
       }
-      if (this.receiveBuffer.length < packetSize) {
+      if (buffer.length - offset < packetSize) {
         break;
       }
 
-      const packetBuffer = this.receiveBuffer.slice(0, packetSize);
+      const packetBuffer = buffer.subarray(offset, offset + packetSize);
       const numericPacket = Array.from(packetBuffer.values());
       this.handlePacket(numericPacket);
-      this.receiveBuffer = this.receiveBuffer.slice(packetSize);
+      offset += packetSize;
     }
-  }
 
-  private findHeader(): number {
-    for (let i = 0; i <= this.receiveBuffer.length - 2; i++) {
-      if (this.receiveBuffer[i] === 0x5A && this.receiveBuffer[i + 1] === 0x5A) {
-        return i;
-      }
+    if (offset > 0) {
+      this.receiveBuffer = buffer.subarray(offset);
     }
-    return -1;
+  }
+
+  private findHeader(fromIndex: number): number {
+    return this.receiveBuffer.indexOf(PACKET_HEADER, fromIndex);
   }
 
   private handlePacket(packet: number[]): void {
@@ -0,0 +1,129 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { mkdtempSync, readFileSync, rmSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { gunzipSync } from 'node:zlib';
+import { CSV_FLUSH_INTERVAL_MS, CSV_FLUSH_LINES, createCsvWriter } from '../src/csv-writer';
+
+const LINES = ['timestamp,voltage,current', '0.000,5.000,1.000', '0.010,5.001,0.999'];
+const EXPECTED_CSV = `${LINES.join('\n')}\n`;
+
+describe('createCsvWriter output targets', () => {
+  let tempDir: string;
+
+  beforeEach(() => {
+    tempDir = mkdtempSync(join(tmpdir(), 'mdp-csv-'));
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+    rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  it('should write plain CSV to a file', async () => {
+    const path = join(tempDir, 'out.csv');
+    const writer = createCsvWriter(path);
+    LINES.forEach((line) => writer.writeLine(line));
+    await writer.close();
+
+    expect(readFileSync(path, 'utf8')).toBe(EXPECTED_CSV);
+  });
+
+  it('should gzip the output when the path ends in .gz', async () => {
+    const path = join(tempDir, 'out.csv.gz');
+    const writer = createCsvWriter(path);
+    LINES.forEach((line) => writer.writeLine(line));
+    await writer.close();
+
+    const compressed = readFileSync(path);
+    expect(compressed[0]).toBe(0x1f);
+    expect(compressed[1]).toBe(0x8b);
+    expect(gunzipSync(compressed).toString('utf8')).toBe(EXPECTED_CSV);
+  });
+
+  it('should write to stdout when no path is given', async () => {
+    const stdoutWrite = vi.spyOn(process.stdout, 'write').mockImplementation(() => true);
+    const writer = createCsvWriter();
+    LINES.forEach((line) => writer.writeLine(line));
+    await writer.close();
+
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+    expect(stdoutWrite).toHaveBeenCalledWith(EXPECTED_CSV);
+  });
+});
+
+describe('createCsvWriter batching', () => {
+  let now: number;
+  let stdoutWrite: ReturnType<typeof vi.spyOn>;
+
+  beforeEach(() => {
+    now = 0;
+    vi.spyOn(performance, 'now').mockImplementation(() => now);
+    stdoutWrite = vi.spyOn(process.stdout, 'write').mockImplementation(() => true);
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  const writtenLines = (): string[] =>
+    stdoutWrite.mock.calls.flatMap(([chunk]) => String(chunk).split('\n').filter((line) => line.length > 0));
+
+  it('should keep lines buffered below the line and time thresholds', () => {
+    const writer = createCsvWriter();
+    for (let i = 0; i < CSV_FLUSH_LINES - 1; i++) {
+      writer.writeLine(`${i}`);
+    }
+    now = CSV_FLUSH_INTERVAL_MS - 1;
+    writer.maybeFlush();
+
+    expect(stdoutWrite).not.toHaveBeenCalled();
+  });
+
+  it('should flush once the line threshold is reached', () => {
+    const writer = createCsvWriter();
+    for (let i = 0; i < CSV_FLUSH_LINES; i++) {
+      writer.writeLine(`${i}`);
+    }
+    writer.maybeFlush();
+
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+    expect(writtenLines()).toHaveLength(CSV_FLUSH_LINES);
+  });
+
+  it('should flush once the time threshold has passed', () => {
+    const writer = createCsvWriter();
+    writer.writeLine('a');
+    writer.maybeFlush();
+    expect(stdoutWrite).not.toHaveBeenCalled();
+
+    now = CSV_FLUSH_INTERVAL_MS;
+    writer.maybeFlush();
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+    expect(stdoutWrite).toHaveBeenCalledWith('a\n');
+
+    // The interval restarts from the last flush
+    writer.writeLine('b');
+    now = CSV_FLUSH_INTERVAL_MS * 2 - 1;
+    writer.maybeFlush();
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+  });
+
+  it('should flush the remainder on close and keep line order across batches', async () => {
+    const writer = createCsvWriter();
+    const expected: string[] = [];
+    for (let i = 0; i < CSV_FLUSH_LINES + 5; i++) {
+      writer.writeLine(`${i}`);
+      expected.push(`${i}`);
+      writer.maybeFlush();
+    }
+    expect(stdoutWrite).toHaveBeenCalledTimes(1);
+
+    writer.writeLine('last');
+    expected.push('last');
+    await writer.close();
+
+    expect(stdoutWrite).toHaveBeenCalledTimes(2);
+    expect(writtenLines()).toEqual(expected);
+  });
+});
@@ -0,0 +1,62 @@
+import { describe, it, expect } from 'vitest';
+import { NodeSerialConnection } from '../src/node-serial';
+
+type ConnectionInternals = {
+  handleIncomingData: (chunk: Buffer) => void;
+  receiveStorage: Buffer;
+  receiveBuffer: Buffer;
+};
+
+const PACKET_TYPE = 0x11;
+
+// Deterministic packets of varying size; payload bytes stay below 0x5A
+function createPackets(count: number): number[][] {
+  const packets: number[][] = [];
+  for (let i = 0; i < count; i++) {
+    const size = 6 + ((i * 37) % 150);
+    const packet = [0x5a, 0x5a, PACKET_TYPE, size, i & 0xff, 0];
+    for (let j = 6; j < size; j++) {
+      packet.push((i + j) % 0x50);
+    }
+    packets.push(packet);
+  }
+  return packets;
+}
+
+function feedInChunks(connection: ConnectionInternals, bytes: number[], chunkSize: number): void {
+  for (let offset = 0; offset < bytes.length; offset += chunkSize) {
+    connection.handleIncomingData(Buffer.from(bytes.slice(offset, offset + chunkSize)));
+  }
+}
+
+describe('NodeSerialConnection receive buffer', () => {
+  it('should keep packets intact across compactions and growth', () => {
+    const connection = new NodeSerialConnection({ portPath: '/dev/null' });
+    const internals = connection as unknown as ConnectionInternals;
+    const received: number[][] = [];
+    connection.registerPacketHandler(PACKET_TYPE, (packet) => received.push(packet));
+
+    const initialCapacity = internals.receiveStorage.length;
+    const before = createPackets(100);
+    const burst = createPackets(120);
+    const after = createPackets(100);
+
+    // Small reads walk the pending view through the store and force repeated compaction
+    const beforeBytes = before.flat();
+    expect(beforeBytes.length).toBeGreaterThan(initialCapacity * 2);
+    feedInChunks(internals, beforeBytes, 7);
+    expect(internals.receiveStorage.length).toBe(initialCapacity);
+
+    // One read larger than the store forces it to grow
+    const burstBytes = burst.flat();
+    expect(burstBytes.length).toBeGreaterThan(initialCapacity);
+    feedInChunks(internals, [0x01, 0x02, ...burstBytes.slice(0, 3)], 5);
+    internals.handleIncomingData(Buffer.from(burstBytes.slice(3)));
+    expect(internals.receiveStorage.length).toBeGreaterThan(initialCapacity);
+
+    feedInChunks(internals, after.flat(), 13);
+
+    expect(received).toEqual([...before, ...burst, ...after]);
+    expect(internals.receiveBuffer.length).toBe(0);
+  });
+});
@@ -3,6 +3,7 @@ export type Unsubscribe = () => void;
 export type Signal<T> = {
   subscribe: (handler: (value: T) => void) => Unsubscribe;
   emit: (value: T) => void;
+  hasSubscribers: () => boolean;
 };
 
 export function createSignal<T>(): Signal<T> {
@@ -19,6 +20,9 @@ export function createSignal<T>(): Signal<T> {
       subscribers.forEach((handler) => {
         handler(value);
       });
+    },
+    hasSubscribers() {
+      return subscribers.size > 0;
     }
   };
 }
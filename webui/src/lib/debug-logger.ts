@@ -47,6 +47,11 @@ debugEnabled.subscribe(value => {
   currentDebugState = value;
 });
 
+// Synchronous read of the debug flag for hot paths that want to skip building log arguments
+export function isDebugEnabled(): boolean {
+  return currentDebugState;
+}
+
 type ConsoleLevel = 'log' | 'warn' | 'error';
 
 function logWithLevel(level: ConsoleLevel, category: string, message: string, args: unknown[]): void {
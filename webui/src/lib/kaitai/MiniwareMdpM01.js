@@ -264,12 +264,7 @@ var MiniwareMdpM01 = (function() {
         this.online = this._io.readU1();
         this.type = this._io.readU1();
         this.lock = this._io.readU1();
-        if (this.type == MiniwareMdpM01.MachineType.L1060) {
-          this.statusLoad = this._io.readU1();
-        }
-        if (this.type != MiniwareMdpM01.MachineType.L1060) {
-          this.statusPsu = this._io.readU1();
-        }
+        this.status = this._io.readU1();
         this.outputOn = this._io.readU1();
         this.color = this._io.readBytes(3);
         this.error = this._io.readU1();
@@ -331,6 +326,26 @@ var MiniwareMdpM01 = (function() {
           return this._m_setVoltage;
         }
       });
+      Object.defineProperty(Chan.prototype, 'statusLoad', {
+        get: function() {
+          if (this._m_statusLoad !== undefined)
+            return this._m_statusLoad;
+          if (this.type == MiniwareMdpM01.MachineType.L1060) {
+            this._m_statusLoad = this.status;
+          }
+          return this._m_statusLoad;
+        }
+      });
+      Object.defineProperty(Chan.prototype, 'statusPsu', {
+        get: function() {
+          if (this._m_statusPsu !== undefined)
+            return this._m_statusPsu;
+          if (this.type != MiniwareMdpM01.MachineType.L1060) {
+            this._m_statusPsu = this.status;
+          }
+          return this._m_statusPsu;
+        }
+      });
 
       return Chan;
     })();
@@ -351,7 +366,7 @@ var MiniwareMdpM01 = (function() {
       this.dummy = this._io.readU1();
       this.groups = [];
       for (var i = 0; i < 10; i++) {
-        this.groups.push(new Group(this._io, this, this._root));
+        this.groups.push(new Group(this._io, this, this._root, this.groupSize));
       }
     }
 
@@ -388,17 +403,18 @@ var MiniwareMdpM01 = (function() {
     })();
 
     var Group = Wave.Group = (function() {
-      function Group(_io, _parent, _root) {
+      function Group(_io, _parent, _root, numItems) {
         this._io = _io;
         this._parent = _parent;
         this._root = _root || this;
+        this.numItems = numItems;
 
         this._read();
       }
       Group.prototype._read = function() {
         this.timestamp = this._io.readU4le();
         this.items = [];
-        for (var i = 0; i < this._parent.groupSize; i++) {
+        for (var i = 0; i < this.numItems; i++) {
           this.items.push(new Item(this._io, this, this._root));
         }
       }
@@ -603,9 +619,9 @@ var MiniwareMdpM01 = (function() {
       this._read();
     }
     Packet.prototype._read = function() {
-      this.magic = this._io.readBytes(2);
-      if (!((KaitaiStream.byteArrayCompare(this.magic, [90, 90]) == 0))) {
-        throw new KaitaiStream.ValidationNotEqualError([90, 90], this.magic, this._io, "/types/packet/seq/0");
+      this.magic = this._io.readU2le();
+      if (!(this.magic == 23130)) {
+        throw new KaitaiStream.ValidationNotEqualError(23130, this.magic, this._io, "/types/packet/seq/0");
       }
       this.packType = this._io.readU1();
       this.size = this._io.readU1();
@@ -1,11 +1,13 @@
+// Built once at module load; this runs for every channel of every synthesize packet
+const MACHINE_TYPE_NAMES: Readonly<Record<number, string>> = {
+  0: 'Node',
+  1: 'P905',
+  2: 'P906',
+  3: 'L1060',
+  16: 'M01 with LCD',
+  17: 'M02 without LCD'
+};
+
 export function getMachineTypeString(type: number): string {
-  const types: Record<number, string> = {
-    0: 'Node',
-    1: 'P905',
-    2: 'P906',
-    3: 'L1060',
-    16: 'M01 with LCD',
-    17: 'M02 without LCD'
-  };
-  return types[type] || `Unknown (${type})`;
+  return MACHINE_TYPE_NAMES[type] || `Unknown (${type})`;
 }
@@ -1,7 +1,6 @@
 import { KaitaiStream, MiniwareMdpM01 } from './kaitai-wrapper';
-import { debugLog, debugError, debugWarn, logDecodedKaitaiData, getPacketTypeDisplay, debugEnabled } from './debug-logger';
+import { debugLog, debugError, debugWarn, logDecodedKaitaiData, getPacketTypeDisplay, isDebugEnabled } from './debug-logger';
 import { getMachineTypeString } from './machine-utils';
-import { get } from 'svelte/store';
 import type { DeviceInfo } from './serial.js';
 import type { Channel, WaveformPoint } from './types';
 import type { AddressData, AddressEntry, MachineData, SynthesizeChannel, SynthesizeData, UpdateChannelData, WaveData } from './types/kaitai';
@@ -90,15 +89,19 @@ export function isUpdateChannelPacket(packet: DecodedPacket): packet is UpdateCh
 }
 
 export function decodePacket(data: Uint8Array | number[] | null): DecodedPacket | null {
-  const currentDebugState = get(debugEnabled);
+  // Read the cached flag; get() would subscribe and unsubscribe on every packet
+  const currentDebugState = isDebugEnabled();
   
+  // Debug messages below are built from template literals, so only format them when logging is on
   if (currentDebugState) {
     console.log('🔍 decodePacket() called, data length:', data ? data.length : 'null');
   }
   
   try {
-    debugLog('packet-decode', 'DECODE PACKET START');
-    debugLog('packet-decode', `  Input data length: ${data ? data.length : 'null'}`);
+    if (currentDebugState) {
+      debugLog('packet-decode', 'DECODE PACKET START');
+      debugLog('packet-decode', `  Input data length: ${data ? data.length : 'null'}`);
+    }
     
     if (!data || data.length < 6) {
       if (currentDebugState) {
@@ -119,9 +122,9 @@ export function decodePacket(data: Uint8Array | number[] | null): DecodedPacket
       return null;
     }
     
-    const packetType = data[2];
-    const typeDisplay = getPacketTypeDisplay(packetType);
-    debugLog('packet-decode', `  Packet type: ${typeDisplay}`);
+    if (currentDebugState) {
+      debugLog('packet-decode', `  Packet type: ${getPacketTypeDisplay(data[2])}`);
+    }
     
     // Validate packet size
     const expectedSize = data[3];
@@ -136,33 +139,36 @@ export function decodePacket(data: Uint8Array | number[] | null): DecodedPacket
       return null;
     }
 
-    debugLog('packet-decode', '  ✅ Packet validation passed');
-    debugLog('kaitai', 'Creating Kaitai parser...');
+    if (currentDebugState) {
+      debugLog('packet-decode', '  ✅ Packet validation passed');
+      debugLog('kaitai', 'Creating Kaitai parser...');
+    }
 
-    const buffer = new ArrayBuffer(data.length);
-    const view = new Uint8Array(buffer);
-    data.forEach((byte: number, i: number) => view[i] = byte);
+    // KaitaiStream reads through a DataView, so Uint8Array input is used as-is.
+    // Serial handlers deliver number[] packets today, which still cost one copy here.
+    const bytes = data instanceof Uint8Array ? data : Uint8Array.from(data);
     
-    const stream = new KaitaiStream(buffer);
-    const parsed = new MiniwareMdpM01(stream);
+    const stream = new KaitaiStream(bytes);
+    // The input is exactly one framed packet (size checked above), so parse it
+    // directly instead of through the root type's repeat-until-eof loop
+    const packet = new MiniwareMdpM01.Packet(stream) as unknown;
     
-    debugLog('kaitai', 'Kaitai parser created successfully');
-    debugLog('kaitai', `Parsed object type: ${parsed.constructor.name}`);
-    debugLog('kaitai', `Packets array length: ${parsed.packets ? parsed.packets.length : 'no packets array'}`);
+    if (currentDebugState) {
+      debugLog('kaitai', 'Kaitai parser created successfully');
+    }
     
-    // The parser creates a packets array, get the first (and only) packet
-    if (parsed.packets && parsed.packets.length > 0) {
-      const packet = parsed.packets[0] as unknown;
-      if (!isPacketBase(packet)) {
-        debugError('kaitai', '  ❌ Parsed packet has unexpected shape');
-        return null;
-      }
-      
+    if (!isPacketBase(packet)) {
       if (currentDebugState) {
-        console.log('✅ decodePacket SUCCESS for packet type:', getPacketTypeDisplay(packet.packType));
-        // Direct console.log of decoded data - only when debug enabled
-        console.log('decoded_data:', packet.data);
+        console.log('❌ decodePacket FAILED: Parsed packet has unexpected shape');
       }
+      debugError('kaitai', '  ❌ Parsed packet has unexpected shape');
+      return null;
+    }
+    
+    if (currentDebugState) {
+      console.log('✅ decodePacket SUCCESS for packet type:', getPacketTypeDisplay(packet.packType));
+      // Direct console.log of decoded data - only when debug enabled
+      console.log('decoded_data:', packet.data);
       
       debugLog('kaitai', `✅ Got packet from Kaitai`);
       debugLog('kaitai', `  Pack type: ${getPacketTypeDisplay(packet.packType)}`);
@@ -170,15 +176,9 @@ export function decodePacket(data: Uint8Array | number[] | null): DecodedPacket
       
       // Log detailed decoded data
       logDecodedKaitaiData('kaitai', packet);
-      
-      return packet;
     }
     
-    if (currentDebugState) {
-      console.log('❌ decodePacket FAILED: No packets found in parsed result');
-    }
-    debugError('kaitai', '  ❌ No packets found in parsed result');
-    return null;
+    return packet;
   } catch (error: unknown) {
     const errorMessage = error instanceof Error ? error.message : String(error);
     const errorStack = error instanceof Error ? error.stack : 'No stack trace';
@@ -192,11 +192,14 @@ export function decodePacket(data: Uint8Array | number[] | null): DecodedPacket
 }
 
 export function processSynthesizePacket(packet: DecodedPacket | null): ChannelUpdate[] | null {
-  debugLog('synthesize', 'PROCESS SYNTHESIZE PACKET START');
-  debugLog('synthesize', '  Packet:', packet);
-  debugLog('synthesize', '  Packet type check:', packet ? packet.packType : 'no packet');
-  debugLog('synthesize', '  Expected type (PackType.SYNTHESIZE):', PackType.SYNTHESIZE);
-  debugLog('synthesize', '  PackType object:', PackType);
+  const debug = isDebugEnabled();
+  if (debug) {
+    debugLog('synthesize', 'PROCESS SYNTHESIZE PACKET START');
+    debugLog('synthesize', '  Packet:', packet);
+    debugLog('synthesize', '  Packet type check:', packet ? packet.packType : 'no packet');
+    debugLog('synthesize', '  Expected type (PackType.SYNTHESIZE):', PackType.SYNTHESIZE);
+    debugLog('synthesize', '  PackType object:', PackType);
+  }
   
   if (!packet || !isSynthesizePacket(packet)) {
     debugError('synthesize', '  ❌ No packet or no data');
@@ -204,18 +207,20 @@ export function processSynthesizePacket(packet: DecodedPacket | null): ChannelUp
   }
   
   const synthesize = packet.data;
-  debugLog('synthesize', '  Synthesize data object:', synthesize);
-  debugLog('synthesize', '  Channels array:', synthesize.channels);
-  debugLog('synthesize', '  Channels length:', synthesize.channels ? synthesize.channels.length : 'no channels');
+  if (debug) {
+    debugLog('synthesize', '  Synthesize data object:', synthesize);
+    debugLog('synthesize', '  Channels array:', synthesize.channels);
+    debugLog('synthesize', '  Channels length:', synthesize.channels ? synthesize.channels.length : 'no channels');
+  }
   
-  const channels: ChannelUpdate[] = [];
+  const channels: ChannelUpdate[] = new Array(6);
   
   for (let i = 0; i < 6; i++) {
-    debugLog('synthesize', `  🔍 Processing channel ${i}:`);
+    const ch = synthesize.channels[i];
     
-    if (!synthesize.channels[i]) {
-      debugWarn('synthesize', `    ❌ No data for channel ${i}`);
-      channels.push({
+    if (!ch) {
+      if (debug) debugWarn('synthesize', `    ❌ No data for channel ${i}`);
+      channels[i] = {
         channel: i,
         online: false,
         machineType: 'Unknown',
@@ -225,46 +230,57 @@ export function processSynthesizePacket(packet: DecodedPacket | null): ChannelUp
         temperature: 0,
         isOutput: false,
         mode: 'Normal'
-      });
+      };
       continue;
     }
     
-    const ch = synthesize.channels[i];
-    debugLog('synthesize', `    Raw channel data:`, ch);
-    debugLog('synthesize', `    Online raw value:`, ch.online);
-    debugLog('synthesize', `    Online !== 0:`, ch.online !== 0);
-    debugLog('synthesize', `    OutVoltage:`, ch.outVoltage);
-    debugLog('synthesize', `    OutCurrent:`, ch.outCurrent);
-    debugLog('synthesize', `    Temperature:`, ch.temperature);
-    debugLog('synthesize', `    OutputOn:`, ch.outputOn);
-    debugLog('synthesize', `    Type:`, ch.type);
+    if (debug) {
+      debugLog('synthesize', `  🔍 Processing channel ${i}:`);
+      debugLog('synthesize', `    Raw channel data:`, ch);
+      debugLog('synthesize', `    Online raw value:`, ch.online);
+      debugLog('synthesize', `    OutVoltage:`, ch.outVoltage);
+      debugLog('synthesize', `    OutCurrent:`, ch.outCurrent);
+      debugLog('synthesize', `    Temperature:`, ch.temperature);
+      debugLog('synthesize', `    OutputOn:`, ch.outputOn);
+      debugLog('synthesize', `    Type:`, ch.type);
+    }
+    
+    // Read each Kaitai getter once; the products below reuse the locals
+    const voltage = ch.outVoltage || 0; // Kaitai already converts to V
+    const current = ch.outCurrent || 0; // Kaitai already converts to A
+    const inputVoltage = ch.inVoltage || 0;
+    const inputCurrent = ch.inCurrent || 0;
+    const targetVoltage = ch.setVoltage || 0;
+    const targetCurrent = ch.setCurrent || 0;
     
     const channelData: ChannelUpdate = {
       channel: i,
       online: ch.online !== 0,
       machineType: getMachineTypeString(ch.type),
-      voltage: ch.outVoltage || 0, // Kaitai already converts to V
-      current: ch.outCurrent || 0, // Kaitai already converts to A
-      power: (ch.outVoltage || 0) * (ch.outCurrent || 0), // W
+      voltage,
+      current,
+      power: voltage * current, // W
       temperature: ch.temperature || 0, // Kaitai already converts to °C
       isOutput: ch.outputOn !== 0,
       mode: getOperatingMode(ch),
       // Add input measurements for extended view
-      inputVoltage: ch.inVoltage || 0, // Kaitai already converts to V
-      inputCurrent: ch.inCurrent || 0, // Kaitai already converts to A
-      inputPower: (ch.inVoltage || 0) * (ch.inCurrent || 0), // W
+      inputVoltage,
+      inputCurrent,
+      inputPower: inputVoltage * inputCurrent, // W
       // Add target values
-      targetVoltage: ch.setVoltage || 0, // Kaitai already converts to V
-      targetCurrent: ch.setCurrent || 0, // Kaitai already converts to A
-      targetPower: (ch.setVoltage || 0) * (ch.setCurrent || 0) // W
+      targetVoltage,
+      targetCurrent,
+      targetPower: targetVoltage * targetCurrent // W
     };
     
-    debugLog('synthesize', `    ✅ Processed channel ${i}:`, channelData);
-    channels.push(channelData);
+    if (debug) debugLog('synthesize', `    ✅ Processed channel ${i}:`, channelData);
+    channels[i] = channelData;
   }
   
-  debugLog('synthesize', '  📋 All processed channels:', channels);
-  debugLog('synthesize', '  🎯 Online channels:', channels.filter(ch => ch.online).map(ch => ch.channel));
+  if (debug) {
+    debugLog('synthesize', '  📋 All processed channels:', channels);
+    debugLog('synthesize', '  🎯 Online channels:', channels.filter(ch => ch.online).map(ch => ch.channel));
+  }
   
   return channels;
 }
@@ -275,15 +291,16 @@ export function processWavePacket(packet: DecodedPacket | null): { channel: numb
   const wave = packet.data;
   const points: WaveformPoint[] = [];
   
-  wave.groups.forEach((group) => {
-    group.items.forEach((item) => {
+  for (const group of wave.groups) {
+    const timestamp = group.timestamp; // All items in a group share the same timestamp
+    for (const item of group.items) {
       points.push({
-        timestamp: group.timestamp, // All items in a group share the same timestamp
+        timestamp,
         voltage: item.voltage, // Kaitai already converts to V
         current: item.current  // Kaitai already converts to A
       });
-    });
-  });
+    }
+  }
   
   return {
     channel: wave.channel,
@@ -291,6 +308,55 @@ export function processWavePacket(packet: DecodedPacket | null): { channel: numb
   };
 }
 
+export type WaveColumns = {
+  channel: number;
+  groupSize: number;
+  timestamps: Uint32Array; // one per group, device units
+  voltage: Float64Array; // groupSize samples per group, V
+  current: Float64Array; // groupSize samples per group, A
+};
+
+const WAVE_HEADER_SIZE = 6;
+const WAVE_GROUP_COUNT = 10;
+
+// Mirrors wave.group_size in cpp/mdp.ksy
+export function getWaveGroupSize(packetSize: number): number {
+  return packetSize === 126 ? 2 : packetSize === 206 ? 4 : 0;
+}
+
+// Bulk-decode a wave packet straight into typed columns, skipping the per-group
+// and per-item Kaitai objects. The layout matches the wave type in cpp/mdp.ksy;
+// samples are scaled to V/A in the same pass, dividing like item.voltage does.
+export function decodeWaveColumns(data: Uint8Array | number[] | null): WaveColumns | null {
+  if (!data || data.length < WAVE_HEADER_SIZE) return null;
+  if (data[0] !== 0x5A || data[1] !== 0x5A || data[2] !== PackType.WAVE || data[3] !== data.length) return null;
+  
+  const groupSize = getWaveGroupSize(data.length);
+  const groupBytes = 4 + groupSize * 4;
+  if (WAVE_HEADER_SIZE + WAVE_GROUP_COUNT * groupBytes > data.length) return null;
+  
+  const bytes = data instanceof Uint8Array ? data : Uint8Array.from(data);
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  const timestamps = new Uint32Array(WAVE_GROUP_COUNT);
+  const voltage = new Float64Array(WAVE_GROUP_COUNT * groupSize);
+  const current = new Float64Array(WAVE_GROUP_COUNT * groupSize);
+  
+  let offset = WAVE_HEADER_SIZE;
+  let sample = 0;
+  for (let group = 0; group < WAVE_GROUP_COUNT; group++) {
+    timestamps[group] = view.getUint32(offset, true);
+    offset += 4;
+    for (let i = 0; i < groupSize; i++) {
+      voltage[sample] = view.getUint16(offset, true) / 1000.0;
+      current[sample] = view.getUint16(offset + 2, true) / 1000.0;
+      offset += 4;
+      sample++;
+    }
+  }
+  
+  return { channel: bytes[4], groupSize, timestamps, voltage, current };
+}
+
 export type ProcessedAddress = { channel: number; address: number[]; frequency: number };
 
 function getAddressBytes(entry: AddressEntry | undefined): number[] {
@@ -329,20 +395,16 @@ export function processMachinePacket(packet: DecodedPacket | null): DeviceInfo |
 }
 
 
-function getOperatingMode(channel: SynthesizeChannel): string {
+// Mode names indexed by the channel's status byte, built once at module load
+const L1060_MODES: Readonly<Record<number, string>> = { 0: 'CC', 1: 'CV', 2: 'CR', 3: 'CP' };
+const P906_MODES: Readonly<Record<number, string>> = { 1: 'CC', 2: 'CV' };
+
+export function getOperatingMode(channel: SynthesizeChannel): string {
   if (channel.type === 3) { // L1060
-    switch(channel.statusLoad) {
-      case 0: return 'CC';
-      case 1: return 'CV';
-      case 2: return 'CR';
-      case 3: return 'CP';
-    }
-  } else if (channel.type === 2) { // P906
-    switch(channel.statusPsu) {
-      case 1: return 'CC';
-      case 2: return 'CV';
-      default: return 'Normal';
-    }
+    return L1060_MODES[channel.statusLoad ?? -1] ?? 'Normal';
+  }
+  if (channel.type === 2) { // P906
+    return P906_MODES[channel.statusPsu ?? -1] ?? 'Normal';
   }
   return 'Normal';
 }
@@ -25,6 +25,20 @@ const SERIAL_CONFIG: SerialConfig = {
   flowControl: 'none'
 };
 
+const RECEIVE_BUFFER_INITIAL_CAPACITY = 4096;
+
+// Locate the 0x5A 0x5A sync word; TypedArray.indexOf keeps the scan in native code
+function findPacketHeader(buffer: Uint8Array, fromIndex = 0): number {
+  let index = buffer.indexOf(0x5A, fromIndex);
+  while (index !== -1 && index < buffer.length - 1) {
+    if (buffer[index + 1] === 0x5A) {
+      return index;
+    }
+    index = buffer.indexOf(0x5A, index + 1);
+  }
+  return -1;
+}
+
 export class SerialConnection {
   private port: SerialPort | null = null;
   private reader: ReadableStreamDefaultReader<Uint8Array> | null = null;
@@ -35,6 +49,7 @@ export class SerialConnection {
   private deviceTypeStore: Writable<DeviceInfo | null>;
   private packetHandlers: Map<number, PacketHandler[]>;
   private receiveBuffer: Uint8Array;
+  private receiveStorage: Uint8Array;
   
   public readonly status: Readable<string>;
   public readonly error: Readable<string | null>;
@@ -46,7 +61,8 @@ export class SerialConnection {
     this.deviceTypeStore = writable(null);
     this.packetHandlers = new Map();
     
-    // Buffer for incomplete packets
+    // Buffer for incomplete packets: a view of the pending bytes inside a reusable backing store
+    this.receiveStorage = new Uint8Array(RECEIVE_BUFFER_INITIAL_CAPACITY);
     this.receiveBuffer = new Uint8Array(0);
     
     // Create derived stores once
@@ -141,10 +157,7 @@ export class SerialConnection {
         
         // Append new data to buffer
         if (value && value.length > 0) {
-          const combined = new Uint8Array(this.receiveBuffer.length + value.length);
-          combined.set(this.receiveBuffer);
-          combined.set(value, this.receiveBuffer.length);
-          this.receiveBuffer = combined;
+          this.appendToReceiveBuffer(value);
           
           // Process complete packets
           this.processIncomingData();
@@ -162,50 +175,78 @@ export class SerialConnection {
     }
   }
 
+  // Append into spare capacity after the pending bytes; only compact or grow the
+  // backing store when it runs out, instead of reallocating on every chunk.
+  private appendToReceiveBuffer(chunk: Uint8Array): void {
+    const pending = this.receiveBuffer;
+    const required = pending.length + chunk.length;
+    let storage = this.receiveStorage;
+    let start = pending.buffer === storage.buffer ? pending.byteOffset - storage.byteOffset : -1;
+
+    if (start === -1 || start + required > storage.length) {
+      if (required > storage.length) {
+        storage = new Uint8Array(Math.max(required, storage.length * 2));
+        this.receiveStorage = storage;
+      }
+      // set() copies correctly even when pending overlaps the destination
+      storage.set(pending, 0);
+      start = 0;
+    }
+
+    storage.set(chunk, start + pending.length);
+    this.receiveBuffer = storage.subarray(start, start + required);
+  }
+
   processIncomingData() {
-    while (this.receiveBuffer.length >= 6) {
+    // Walk the buffer with a read offset and drop consumed bytes once at the end,
+    // so a burst of packets doesn't copy the remaining buffer after every packet.
+    const buffer = this.receiveBuffer;
+    let offset = 0;
+
+    while (buffer.length - offset >= 6) {
       // Find packet header (0x5A 0x5A)
-      let headerIndex = -1;
-      for (let i = 0; i <= this.receiveBuffer.length - 2; i++) {
-        if (this.receiveBuffer[i] === 0x5A && this.receiveBuffer[i + 1] === 0x5A) {
-          headerIndex = i;
-          break;
-        }
-      }
+      const headerIndex = findPacketHeader(buffer, offset);
 
       // No valid header found
       if (headerIndex === -1) {
         // If we have more than 256 bytes without a header, clear buffer to prevent memory issues
-        if (this.receiveBuffer.length > 256) {
-          this.receiveBuffer = new Uint8Array(0);
+        if (buffer.length - offset > 256) {
+          offset = buffer.length;
         }
         break;
       }
 
-      // Remove any garbage before header
-      if (headerIndex > 0) {
-        this.receiveBuffer = this.receiveBuffer.slice(headerIndex);
-      }
+      // Skip any garbage before header
+      offset = headerIndex;
 
       // Check if we have enough data for the complete packet
-      if (this.receiveBuffer.length < 4) {
+      if (buffer.length - offset < 4) {
         break; // Need at least 4 bytes to read size
       }
       
-      const packetSize = this.receiveBuffer[3];
+      const packetSize = buffer[offset + 3];
+      if (packetSize < 6) {
+        // Drop one byte to avoid a tight loop on malformed sizes.
+        offset += 1;
+        continue;
+      }
       
-      if (this.receiveBuffer.length < packetSize) {
+      if (buffer.length - offset < packetSize) {
         // Not enough data yet for complete packet
         break;
       }
       
       // Extract complete packet
-      const packet = this.receiveBuffer.slice(0, packetSize);
+      const packet = buffer.subarray(offset, offset + packetSize);
       
       this.handlePacket(Array.from(packet)); // Convert to array for compatibility
       
-      // Remove processed packet from buffer
-      this.receiveBuffer = this.receiveBuffer.slice(packetSize);
+      offset += packetSize;
+    }
+
+    // Remove processed packets and garbage from buffer
+    if (offset > 0) {
+      this.receiveBuffer = buffer.subarray(offset);
     }
   }
 
@@ -28,32 +28,53 @@ export function createPacketBus(serial: SerialConnection): PacketBus {
   let started = false;
   let unsubscribes: Unsubscribe[] = [];
 
+  // Whether anyone would receive a decoded packet of this type
+  const hasDecodedListeners = (packType: number): boolean => {
+    if (onDecodedPacket.hasSubscribers()) return true;
+    switch (packType) {
+      case PackType.SYNTHESIZE:
+        return onSynthesize.hasSubscribers();
+      case PackType.WAVE:
+        return onWave.hasSubscribers();
+      case PackType.ADDR:
+        return onAddress.hasSubscribers();
+      case PackType.MACHINE:
+        return onMachine.hasSubscribers();
+      case PackType.UPDAT_CH:
+        return onUpdateChannel.hasSubscribers();
+      default:
+        return false;
+    }
+  };
+
   const handlePacket = (packet: number[]): void => {
     onRawPacket.emit(packet);
 
+    // Skip the Kaitai parse entirely for packets nobody listens to in decoded form
+    if (!hasDecodedListeners(packet[2])) return;
+
     const decoded = decodePacket(packet);
     if (!decoded) return;
 
     onDecodedPacket.emit(decoded);
 
-    if (isSynthesizePacket(decoded)) {
-      onSynthesize.emit(decoded);
-      return;
-    }
-    if (isWavePacket(decoded)) {
-      onWave.emit(decoded);
-      return;
-    }
-    if (isAddressPacket(decoded)) {
-      onAddress.emit(decoded);
-      return;
-    }
-    if (isMachinePacket(decoded)) {
-      onMachine.emit(decoded);
-      return;
-    }
-    if (isUpdateChannelPacket(decoded)) {
-      onUpdateChannel.emit(decoded);
+    // Route on the type byte so each packet runs only its own shape guard
+    switch (decoded.packType) {
+      case PackType.SYNTHESIZE:
+        if (isSynthesizePacket(decoded)) onSynthesize.emit(decoded);
+        break;
+      case PackType.WAVE:
+        if (isWavePacket(decoded)) onWave.emit(decoded);
+        break;
+      case PackType.ADDR:
+        if (isAddressPacket(decoded)) onAddress.emit(decoded);
+        break;
+      case PackType.MACHINE:
+        if (isMachinePacket(decoded)) onMachine.emit(decoded);
+        break;
+      case PackType.UPDAT_CH:
+        if (isUpdateChannelPacket(decoded)) onUpdateChannel.emit(decoded);
+        break;
     }
   };
 
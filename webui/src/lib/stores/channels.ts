@@ -10,6 +10,8 @@ import type { SerialConnection } from '../serial';
 
 export type ChannelStore = ReturnType<typeof createChannelStore>;
 
+const VALID_MACHINE_TYPES: ReadonlySet<string> = new Set(['Node', 'P905', 'P906', 'L1060', 'Unknown']);
+
 export function createChannelStore(options: { serial: SerialConnection; packets: PacketBus }): {
   channels: Writable<Channel[]>;
   activeChannel: Readable<number>;
@@ -96,8 +98,7 @@ export function createChannelStore(options: { serial: SerialConnection; packets:
       isValid = false;
     }
 
-    const validTypes = ['Node', 'P905', 'P906', 'L1060', 'Unknown'];
-    if (typeof channelData.machineType !== 'string' || !validTypes.includes(channelData.machineType)) {
+    if (typeof channelData.machineType !== 'string' || !VALID_MACHINE_TYPES.has(channelData.machineType)) {
       warnings.push(`Invalid machine type: ${String(channelData.machineType)}`);
       isValid = false;
     }
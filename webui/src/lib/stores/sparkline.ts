@@ -66,10 +66,19 @@ export function createSparklineStore(options: { channels: Readable<Channel[]> })
         data[channel][metric] = [];
       }
 
-      data[channel][metric].push({ timestamp, value });
+      const points = data[channel][metric];
+      points.push({ timestamp, value });
 
+      // Points arrive in time order, so expired ones form a prefix of the window;
+      // drop just that prefix instead of re-filtering the whole window per sample.
       const cutoffTime = timestamp - WINDOW_DURATION_MS;
-      data[channel][metric] = data[channel][metric].filter((point) => point.timestamp >= cutoffTime);
+      let expired = 0;
+      while (expired < points.length && points[expired].timestamp < cutoffTime) {
+        expired++;
+      }
+      if (expired > 0) {
+        points.splice(0, expired);
+      }
 
       return data;
     });
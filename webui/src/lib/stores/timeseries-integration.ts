@@ -4,43 +4,11 @@
  */
 
 import { get } from 'svelte/store';
-import type { SynthesizeChannel } from '../types/kaitai';
+import { getOperatingMode } from '../packet-decoder';
 import type { PacketBus } from '../services/packet-bus';
 import type { ChannelStore } from './channels';
 import type { TimeseriesStore, TimeSeriesPoint } from './timeseries';
 
-function getOperatingMode(channel: SynthesizeChannel): string {
-  // L1060
-  if (channel.type === 3) {
-    switch (channel.statusLoad) {
-      case 0:
-        return 'CC';
-      case 1:
-        return 'CV';
-      case 2:
-        return 'CR';
-      case 3:
-        return 'CP';
-      default:
-        return 'Normal';
-    }
-  }
-
-  // P906
-  if (channel.type === 2) {
-    switch (channel.statusPsu) {
-      case 1:
-        return 'CC';
-      case 2:
-        return 'CV';
-      default:
-        return 'Normal';
-    }
-  }
-
-  return 'Normal';
-}
-
 type MetricStats = { min: number; max: number; avg: number };
 type ChannelStats = { voltage: MetricStats; current: MetricStats; power: MetricStats; sampleCount: number };
 export type SessionStats = {
@@ -81,8 +49,11 @@ export function createTimeseriesIntegration(options: {
       const timestamp = Date.now();
       const points: TimeSeriesPoint[] = [];
 
-      packet.data.channels.forEach((channelData, index: number) => {
-        if (!activeSession.channels.has(index)) return;
+      // Visit only the recorded channels rather than testing all six against the set
+      const channels = packet.data.channels;
+      for (const index of activeSession.channels) {
+        const channelData = channels[index];
+        if (!channelData) continue;
         points.push({
           channel: index,
           timestamp,
@@ -94,7 +65,7 @@ export function createTimeseriesIntegration(options: {
             isOutput: channelData.outputOn !== 0,
           },
         });
-      });
+      }
 
       if (points.length > 0) {
         timeseries.addDataPoints(points);
@@ -155,8 +126,7 @@ export function createTimeseriesIntegration(options: {
     const targetSessionId = sessionId || get(timeseries.activeSession)?.id;
     if (!targetSessionId) return '';
 
-    const sessions = get(timeseries.sessionList);
-    const session = sessions.find((s) => s.id === targetSessionId);
+    const session = get(timeseries).sessions.get(targetSessionId);
     if (!session) return '';
 
     const data = timeseries.getDataRange(
@@ -231,8 +201,7 @@ export function createTimeseriesIntegration(options: {
     const targetSessionId = sessionId || get(timeseries.activeSession)?.id;
     if (!targetSessionId) return null;
 
-    const sessions = get(timeseries.sessionList);
-    const session = sessions.find((s) => s.id === targetSessionId);
+    const session = get(timeseries).sessions.get(targetSessionId);
     if (!session) return null;
 
     const stats: SessionStats = {
@@ -246,10 +215,11 @@ export function createTimeseriesIntegration(options: {
       channelStats: {},
     };
 
+    // Only materialize the channels the stats cover, not every channel in the session.
     const data = timeseries.getDataRange(
       session.metadata.minTimestamp || session.startTime,
       session.metadata.maxTimestamp || Date.now(),
-      null,
+      stats.channels,
       targetSessionId
     );
 
@@ -26,6 +26,8 @@ export interface MiniwareMdpM01Constructor {
   // Kaitai classes accept a stream-like object; keep loose here to avoid
   // depending on a specific KaitaiStream module format (UMD/ESM).
   new (io: unknown): MiniwareMdpM01;
+  // Parses exactly one packet from the stream, without the root repeat-until-eof loop
+  Packet: new (io: unknown) => MiniwareMdpM01Packet;
 }
 
 export interface MiniwareMdpM01Packet<TData = unknown> {
@@ -55,6 +57,7 @@ export interface SynthesizeChannel {
   online: number;
   type: number;
   lock: number;
+  status: number;
   statusLoad?: number;
   statusPsu?: number;
   outputOn: number;
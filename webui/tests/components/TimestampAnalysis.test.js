@@ -0,0 +1,73 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { render } from '@testing-library/svelte';
+import { tick } from 'svelte';
+import * as Plot from '@observablehq/plot';
+import { createSignal } from '$lib/core/signal.js';
+import { createMockWaveData } from '../helpers/mock-packet-factory.js';
+
+// Mock Observable Plot
+vi.mock('@observablehq/plot', () => {
+  const mockPlot = vi.fn((options) => {
+    const element = document.createElement('svg');
+    element.setAttribute('width', options?.width || '800');
+    element.setAttribute('height', options?.height || '400');
+    return element;
+  });
+
+  return {
+    plot: mockPlot,
+    line: vi.fn((data, options) => ({ type: 'line', data, options })),
+    dot: vi.fn((data, options) => ({ type: 'dot', data, options })),
+    ruleX: vi.fn((data, options) => ({ type: 'ruleX', data, options })),
+    default: {
+      plot: mockPlot,
+      line: vi.fn((data, options) => ({ type: 'line', data, options })),
+      dot: vi.fn((data, options) => ({ type: 'dot', data, options })),
+      ruleX: vi.fn((data, options) => ({ type: 'ruleX', data, options }))
+    }
+  };
+});
+
+import TimestampAnalysis from '$lib/components/TimestampAnalysis.svelte';
+
+describe('TimestampAnalysis Component', () => {
+  let packetBus;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.useFakeTimers();
+    packetBus = { onWave: createSignal() };
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('should throttle redraws once the point cap is reached', async () => {
+    render(TimestampAnalysis, {
+      props: { channel: 0, isRecording: true, packetBus }
+    });
+    await tick();
+
+    // Past 50 packets every wave packet trims and reassigns the point buffer
+    for (let i = 0; i < 60; i++) {
+      packetBus.onWave.emit({ packType: 0x12, data: createMockWaveData(0) });
+      await tick();
+    }
+
+    expect(Plot.plot).not.toHaveBeenCalled();
+
+    vi.advanceTimersByTime(50);
+    expect(Plot.plot).toHaveBeenCalledTimes(1);
+
+    // The next burst within the interval is coalesced into one more redraw
+    for (let i = 0; i < 10; i++) {
+      packetBus.onWave.emit({ packType: 0x12, data: createMockWaveData(0) });
+      await tick();
+    }
+    expect(Plot.plot).toHaveBeenCalledTimes(1);
+
+    vi.advanceTimersByTime(50);
+    expect(Plot.plot).toHaveBeenCalledTimes(2);
+  });
+});
@@ -188,6 +188,10 @@ vi.mock('$lib/kaitai-wrapper.js', () => {
   }
   
   MockMiniwareMdpM01.PackType = PackType;
+  // Single-packet entry point used by decodePacket, like the generated MiniwareMdpM01.Packet
+  MockMiniwareMdpM01.Packet = function Packet(stream) {
+    return new MockMiniwareMdpM01(stream).packets[0];
+  };
   
   return {
     KaitaiStream: MockKaitaiStream,
@@ -23,5 +23,16 @@ describe('createSignal', () => {
     signal.emit('ignored');
     expect(handler).not.toHaveBeenCalled();
   });
+
+  it('reports whether it has subscribers', () => {
+    const signal = createSignal();
+    expect(signal.hasSubscribers()).toBe(false);
+
+    const unsubscribe = signal.subscribe(vi.fn());
+    expect(signal.hasSubscribers()).toBe(true);
+
+    unsubscribe();
+    expect(signal.hasSubscribers()).toBe(false);
+  });
 });
 
@@ -26,7 +26,8 @@ vi.mock('../../../src/lib/debug-logger.js', () => ({
   debugWarn: vi.fn(),
   logPacketData: vi.fn(),
   getPacketTypeDisplay: vi.fn((type) => `PACKET_${type}`),
-  debugEnabled: { subscribe: vi.fn() }
+  debugEnabled: { subscribe: vi.fn() },
+  isDebugEnabled: vi.fn(() => false)
 }));
 
 import { SerialConnection } from '../../../src/lib/serial.js';
@@ -180,6 +180,10 @@ vi.mock('$lib/kaitai-wrapper.js', () => {
   }
   
   MiniwareMdpM01.PackType = PackType;
+  // Single-packet entry point used by decodePacket, like the generated MiniwareMdpM01.Packet
+  MiniwareMdpM01.Packet = function Packet(stream) {
+    return new MiniwareMdpM01(stream).packets[0];
+  };
   
   return {
     KaitaiStream,
@@ -194,6 +198,7 @@ import {
   processWavePacket,
   processAddressPacket,
   processMachinePacket,
+  decodeWaveColumns,
   PackType
 } from '$lib/packet-decoder.js';
 
@@ -330,6 +335,40 @@ describe('Packet Decoder', () => {
     });
   });
 
+  describe('decodeWaveColumns', () => {
+    it('should decode a 2 point per group wave packet into columns', () => {
+      const points = Array.from({ length: 20 }, (_, i) => ({ voltage: 1000 + i, current: 200 + i }));
+      const rawPacket = createWavePacket(3, points);
+      const columns = decodeWaveColumns(rawPacket);
+
+      expect(columns).toBeTruthy();
+      expect(columns.channel).toBe(3);
+      expect(columns.groupSize).toBe(2);
+      expect(Array.from(columns.timestamps)).toEqual([100, 200, 300, 400, 500, 600, 700, 800, 900, 1000]);
+      expect(Array.from(columns.voltage)).toEqual(points.map((p) => p.voltage / 1000));
+      expect(Array.from(columns.current)).toEqual(points.map((p) => p.current / 1000));
+    });
+
+    it('should match the Kaitai-decoded samples', () => {
+      const rawPacket = createWavePacket(0, 206);
+      const columns = decodeWaveColumns(Array.from(rawPacket));
+      const processed = processWavePacket(decodePacket(rawPacket));
+
+      expect(columns.voltage).toHaveLength(40);
+      processed.points.forEach((point, i) => {
+        expect(columns.voltage[i]).toBeCloseTo(point.voltage);
+        expect(columns.current[i]).toBeCloseTo(point.current);
+      });
+    });
+
+    it('should return null for non-wave or malformed packets', () => {
+      expect(decodeWaveColumns(null)).toBeNull();
+      expect(decodeWaveColumns(createSynthesizePacket())).toBeNull();
+      expect(decodeWaveColumns(createMalformedPacket('short'))).toBeNull();
+      expect(decodeWaveColumns(createWavePacket(0, 126).slice(0, 100))).toBeNull();
+    });
+  });
+
   describe('processAddressPacket', () => {
     it('should process address packet', () => {
       const rawPacket = createAddressPacket();
@@ -273,6 +273,72 @@ describe('SerialConnection Buffer Management', () => {
     });
   });
 
+  // Correctness only: a wall-clock bound (e.g. < 1 ms for 10 kB) would be flaky on shared CI runners
+  describe('Large Buffer Framing', () => {
+    it('should find a packet at a known offset in a 10 kB noisy buffer', () => {
+      const packet = createSynthesizePacket();
+      const noise = createNoise(10 * 1024, 1);
+      const offset = 5000;
+      const buffer = new Uint8Array(noise.length + packet.length);
+      buffer.set(noise.subarray(0, offset));
+      buffer.set(packet, offset);
+      buffer.set(noise.subarray(offset), offset + packet.length);
+
+      const receivedPackets = [];
+      serialConnection.registerPacketHandler(0x11, (packet) => {
+        receivedPackets.push(packet);
+      });
+
+      serialConnection.receiveBuffer = buffer;
+      serialConnection.processIncomingData();
+
+      expect(receivedPackets.length).toBe(1);
+      expect(receivedPackets[0]).toEqual(packet);
+      // Over 256 bytes of trailing noise without a header is discarded
+      expect(serialConnection.receiveBuffer.length).toBe(0);
+    });
+
+    it('should extract every packet from a long burst in order', () => {
+      const heartbeat = createHeartbeatPacket();
+      const synthesize = createSynthesizePacket();
+      const noise = createNoise(64, 2);
+      const stream = [];
+      for (let i = 0; i < 50; i++) {
+        stream.push(...(i % 2 === 0 ? heartbeat : synthesize));
+        if (i % 5 === 0) stream.push(...noise);
+      }
+
+      const receivedTypes = [];
+      serialConnection.registerPacketHandler(0x22, () => receivedTypes.push(0x22));
+      serialConnection.registerPacketHandler(0x11, () => receivedTypes.push(0x11));
+
+      serialConnection.receiveBuffer = new Uint8Array(stream);
+      serialConnection.processIncomingData();
+
+      const expectedTypes = Array.from({ length: 50 }, (_, i) => (i % 2 === 0 ? 0x22 : 0x11));
+      expect(receivedTypes).toEqual(expectedTypes);
+      expect(serialConnection.receiveBuffer.length).toBe(0);
+    });
+
+    it('should skip a header with an invalid size and keep scanning', () => {
+      const packet = createHeartbeatPacket();
+      const decoy = [0x5A, 0x5A, 0x22, 0x00]; // Size 0 can never be a packet
+      const buffer = new Uint8Array([...decoy, ...packet]);
+
+      const receivedPackets = [];
+      serialConnection.registerPacketHandler(0x22, (packet) => {
+        receivedPackets.push(packet);
+      });
+
+      serialConnection.receiveBuffer = buffer;
+      serialConnection.processIncomingData();
+
+      expect(receivedPackets.length).toBe(1);
+      expect(receivedPackets[0]).toEqual(packet);
+      expect(serialConnection.receiveBuffer.length).toBe(0);
+    });
+  });
+
   describe('ReadLoop Integration', () => {
     it('should process split packets through readLoop', async () => {
       const packet = createSynthesizePacket();
@@ -339,9 +405,52 @@ describe('SerialConnection Buffer Management', () => {
 
       expect(receivedTypes).toEqual(['heartbeat', 'machine', 'wave']);
     });
+
+    it('should keep packets intact across many small reads', async () => {
+      const packet = createSynthesizePacket();
+      const packetCount = 40; // 6240 bytes, enough to wrap the receive storage several times
+      const allData = [];
+      for (let i = 0; i < packetCount; i++) {
+        allData.push(...packet);
+      }
+
+      const receivedPackets = [];
+      serialConnection.registerPacketHandler(0x11, (packet) => {
+        receivedPackets.push(packet);
+      });
+
+      let position = 0;
+      mockReader.read.mockImplementation(() => {
+        if (position < allData.length) {
+          const chunk = allData.slice(position, position + 7);
+          position += chunk.length;
+          return Promise.resolve({ value: new Uint8Array(chunk), done: false });
+        }
+        return Promise.resolve({ done: true });
+      });
+
+      await serialConnection.connect();
+      await new Promise(resolve => setTimeout(resolve, 50));
+
+      expect(receivedPackets.length).toBe(packetCount);
+      receivedPackets.forEach((received) => expect(received).toEqual(packet));
+      expect(serialConnection.receiveBuffer.length).toBe(0);
+    });
   });
 
   // Helper functions to create test packets
+  // Deterministic filler that never contains the 0x5A sync byte
+  function createNoise(length, seed) {
+    const noise = new Uint8Array(length);
+    let state = seed;
+    for (let i = 0; i < length; i++) {
+      state = (Math.imul(state, 1103515245) + 12345) & 0x7FFFFFFF;
+      const byte = (state >> 16) & 0xFF;
+      noise[i] = byte === 0x5A ? 0x00 : byte;
+    }
+    return noise;
+  }
+
   function createHeartbeatPacket() {
     return [0x5A, 0x5A, 0x22, 0x06, 0xEE, 0x00];
   }
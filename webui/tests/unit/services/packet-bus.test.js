@@ -1,4 +1,13 @@
 import { describe, expect, it, vi } from 'vitest';
+
+const decodePacketSpy = vi.hoisted(() => vi.fn());
+
+vi.mock('$lib/packet-decoder.js', async (importOriginal) => {
+  const actual = await importOriginal();
+  decodePacketSpy.mockImplementation(actual.decodePacket);
+  return { ...actual, decodePacket: decodePacketSpy };
+});
+
 import { createPacketBus } from '$lib/services/packet-bus';
 import { PackType } from '$lib/packet-decoder.js';
 import { createMalformedPacket, createSynthesizePacket } from '../../mocks/packet-data.js';
@@ -99,5 +108,30 @@ describe('createPacketBus', () => {
     expect(onRawPacket).toHaveBeenCalledTimes(1);
     expect(onDecodedPacket).not.toHaveBeenCalled();
   });
+
+  it('only decodes packets that have decoded listeners', () => {
+    const serial = createFakeSerial();
+    const bus = createPacketBus(serial);
+
+    const onRawPacket = vi.fn();
+    const onWave = vi.fn();
+    bus.onRawPacket.subscribe(onRawPacket);
+    bus.onWave.subscribe(onWave);
+
+    bus.start();
+    decodePacketSpy.mockClear();
+
+    serial.emit(PackType.SYNTHESIZE, Array.from(createSynthesizePacket()));
+    expect(onRawPacket).toHaveBeenCalledTimes(1);
+    expect(decodePacketSpy).not.toHaveBeenCalled();
+
+    const onSynthesize = vi.fn();
+    bus.onSynthesize.subscribe(onSynthesize);
+
+    serial.emit(PackType.SYNTHESIZE, Array.from(createSynthesizePacket()));
+    expect(decodePacketSpy).toHaveBeenCalledTimes(1);
+    expect(onSynthesize).toHaveBeenCalledTimes(1);
+    expect(onWave).not.toHaveBeenCalled();
+  });
 });
 